@@ -57,6 +57,7 @@ class _SingleInstrumentNGram(object):
         frames = OrderedFrames(self.frame_size)
         # used to set the tempo of each frame component
         tempo_event_iterator = DictIterator(tempo_dict)
+        pauses_to_previous_event, pauses_to_next_event = compute_pauses(times)
         for time_index in range(0, len(times), 1):
             start_time = times[time_index]
             tempo_event = None
@@ -68,16 +69,8 @@ class _SingleInstrumentNGram(object):
                     tempo_event_iterator.go_previous()
                 tempo_event = tempo_event_iterator.current_value()
             sound_event = track.get_sound_event(start_time)
-
-            # update previous pause
-            pause_to_previous_event = 0
-            if time_index - 1 >= 0:
-                pause_to_previous_event = start_time - times[time_index - 1]
-
-            # update next pause
-            pause_to_next_event = 0
-            if time_index + 1 < len(times):
-                pause_to_next_event = times[time_index + 1] - start_time
+            pause_to_previous_event = pauses_to_previous_event[time_index]
+            pause_to_next_event = pauses_to_next_event[time_index]
 
             # create frame and add it
             frame_component = FrameComponent(sound_event=sound_event, tempo_event=tempo_event,
@@ -96,7 +89,7 @@ class _SingleInstrumentNGram(object):
         self.indexer.index_frames()
 
     def get_first_frame(self):
-        return self.frame_distribution.keys()[0]
+        return next(iter(self.frame_distribution))
 
     def get_random_frame(self):
         index = randint(0, len(self.frame_distribution) - 1)
@@ -121,7 +114,7 @@ class SoundEventFrameIndexer(object):
         # maps statistical data to frames
         self.frame_dict = frame_dict
         # maps frames to the sound events that are first in the frame
-        self.first_sound_event_frames = defaultdict(lambda: [])
+        self.first_sound_event_frames = defaultdict(list)
 
     def index_frames(self):
         """
@@ -146,8 +139,9 @@ class SoundEventFrameIndexer(object):
         return self.first_sound_event_frames[sound_event]
 
     def get_best_frame(self, sound_event):
-        if len(self.first_sound_event_frames[sound_event]) > 0:
-            (frame, data) = self.first_sound_event_frames[sound_event][-1]
+        frames = self.first_sound_event_frames.get(sound_event)
+        if frames:
+            (frame, data) = frames[-1]
             return frame
         return None
 
@@ -167,10 +161,12 @@ class MultiInstrumentNGram(object):
             self.add_instrument_track(instrument, track, music_transcript.get_tempo_dict())
 
     def add_instrument_track(self, instrument, track, tempo_dict):
-        if instrument not in self.instrument_ngrams:
-            self.instrument_ngrams[instrument] = _SingleInstrumentNGram(self.nsize)
-        self.instrument_ngrams[instrument].build_from_track(track, tempo_dict)
-        self.instrument_ngrams[instrument].sort_and_index()
+        ngram = self.instrument_ngrams.get(instrument)
+        if ngram is None:
+            ngram = _SingleInstrumentNGram(self.nsize)
+            self.instrument_ngrams[instrument] = ngram
+        ngram.build_from_track(track, tempo_dict)
+        ngram.sort_and_index()
 
     def get_ngram(self, instrument):
         """
@@ -217,31 +213,33 @@ class OrderedFrames(object):
     def reset(self):
         self.frames = []
 
-    def __sizeof__(self):
+    def __len__(self):
         return len(self.frames)
 
 
 class Frame(object):
     """
-    Object that encapsulates a tuple of Frame Components, and represents a progression of notes
+    Object that encapsulates a list of Frame Components, and represents a progression of notes
     """
 
     def __init__(self, max_size=0):
         self.max_size = max_size
-        self.components = ()
+        self.components = []
         self.hash = None
 
     def get_components(self):
         """
-        :return: the tuple of frame components
+        :return: the list of frame components
         """
         return self.components
 
     def add(self, frame_component):
-        self.components += (frame_component,)
+        self.components.append(frame_component)
+        self.hash = None
 
     def remove_first(self):
-        self.components = self.components[1:]
+        del self.components[0]
+        self.hash = None
 
     def is_full(self):
         return len(self.components) == self.max_size
@@ -252,16 +250,16 @@ class Frame(object):
     def last(self):
         return self.components[-1]
 
-    def __sizeof__(self):
+    def __len__(self):
         return len(self.components)
 
     def __hash__(self):
-        if not self.hash:
-            self.hash = hash(self.components)
+        if self.hash is None:
+            self.hash = hash(tuple(self.components))
         return self.hash
 
     def __eq__(self, other):
-        return self.__hash__() == other.__hash__()
+        return self.components == other.components
 
     def __str__(self):
         string = "Frame:"
@@ -295,6 +293,13 @@ class FrameComponent(object):
             self.hash = frame_component_hash_function(self)
         return self.hash
 
+    def __eq__(self, other):
+        """
+        Components with equal sound events are equal, so the indexer matches any frame that starts with an equal
+        sound event, not only the identical component
+        """
+        return frame_component_equality_function(self, other)
+
     def __str__(self):
         return "{}{}{}{}".format(self.sound_event, self.tempo_event, self.pause_to_next_event,
                                  self.pause_to_previous_event)
@@ -320,6 +325,18 @@ class FrameStatisticalData(object):
         return "count:{}, elapsed:{}".format(self.count, self.last_played_elapsed)
 
 
+def compute_pauses(times):
+    """
+    Computes the pauses between consecutive sound events in one pass over the times
+    :param times: sorted list of sound event start times
+    :return: tuple of lists (pauses to previous event, pauses to next event), with 0 at the track edges
+    """
+    if not times:
+        return [], []
+    pauses = [next_start - start for start, next_start in zip(times, times[1:])]
+    return [0] + pauses, pauses + [0]
+
+
 def prioritize_count_and_last_played_elapsed(frame_statistical_data1, frame_statistical_data2):
     return (frame_statistical_data1.count + frame_statistical_data1.last_played_elapsed) - \
            (frame_statistical_data2.count + frame_statistical_data2.last_played_elapsed)
@@ -329,5 +346,10 @@ def hash_sound_event(frame_component):
     return hash(frame_component.sound_event)
 
 
+def are_sound_events_equal(frame_component1, frame_component2):
+    return frame_component1.sound_event == frame_component2.sound_event
+
+
 frame_statistical_data_comparison_function = prioritize_count_and_last_played_elapsed
 frame_component_hash_function = hash_sound_event
+frame_component_equality_function = are_sound_events_equal
@@ -109,14 +109,17 @@ class TranscriptLoader(object):
         present_time = 0
         on_notes = {}
         track = InstrumentTrack()
-        for event_index in range(0, len(miditrack), 1):
-            event = miditrack[event_index]
+        # bound once since they are called for every event of the track
+        is_new_note = MidiUtils.is_new_note
+        has_note_ended = MidiUtils.has_note_ended
+        add_note = track.add_note
+        for event in miditrack:
             present_time += event.tick
-            if MidiUtils.is_new_note(event):
+            if is_new_note(event):
                 note = Note(start_time=present_time, pitch=event.pitch, volume=event.velocity)
                 on_notes[note.pitch] = note
-                track.add_note(note)
-            if MidiUtils.has_note_ended(event):
+                add_note(note)
+            if has_note_ended(event):
                 note = on_notes[event.pitch]
                 note.duration = present_time - note.start_time
         instrument = MidiUtils.get_instrument(miditrack)
@@ -1,4 +1,4 @@
-from collections import OrderedDict, defaultdict
+from collections import defaultdict
 from graphmodel.utils import MidiUtils
 
 __author__ = 'Adisor'
@@ -35,7 +35,9 @@ class AbstractEventsScheduledTrack(object):
     """
     def __init__(self, channel=None):
         self.channel = channel
-        self._scheduled_events = defaultdict(lambda: [])
+        self._scheduled_events = defaultdict(list)
+        # times of the scheduled events in sorted order, built by sort()
+        self._sorted_times = []
         self.duration = 0
 
     def schedule_event(self, event, start):
@@ -51,15 +53,21 @@ class AbstractEventsScheduledTrack(object):
         """
         return self._scheduled_events
 
+    def get_sorted_times(self):
+        """
+        :return: list of times at which events are scheduled, sorted by the last call to sort()
+        """
+        return self._sorted_times
+
     def sort(self):
         """
-        :return: list of sound event objects sorted by time
+        Sorts the times at which events are scheduled
         """
-        self._scheduled_events = OrderedDict(sorted(self._scheduled_events.items(), key=lambda key: key[0]))
+        self._sorted_times = sorted(self._scheduled_events)
 
     def __str__(self):
         string = ""
-        for time in self._scheduled_events:
+        for time in sorted(self._scheduled_events):
             string += str(time) + " " + str(self._scheduled_events[time]) + "\n"
         return string
 
@@ -49,7 +49,7 @@ class MidiTrackWriter(object):
         """
         self.track_schedule.sort()
         last_time = 0
-        for time in self.track_schedule.get_scheduled_events():
+        for time in self.track_schedule.get_sorted_times():
             last_time = self.append_events_to_track(time, last_time)
         self.track.append(events.EndOfTrackEvent(tick=1))
         return self.track
@@ -153,9 +153,11 @@ class InstrumentTrack(object):
         Adds a note to the current sound event, and if there is no sound event at the note start time,
         a new sound event is created
         """
-        if note.start_time not in self._sound_events:
-            self._sound_events[note.start_time] = InstrumentSoundEvent()
-        self._sound_events.get(note.start_time).add_note(note)
+        sound_event = self._sound_events.get(note.start_time)
+        if sound_event is None:
+            sound_event = InstrumentSoundEvent()
+            self._sound_events[note.start_time] = sound_event
+        sound_event.add_note(note)
 
     def __len__(self):
         return len(self._sound_events)
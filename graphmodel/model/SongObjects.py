@@ -1,3 +1,5 @@
+from operator import attrgetter
+
 from graphmodel.model import instruments
 
 __author__ = 'Adisor'
@@ -13,18 +15,20 @@ class InstrumentSoundEvent(object):
     def __init__(self, instrument=instruments.PIANO):
         self._instrument = instrument
         self._notes = []
+        self._notes_tuple = None
         self._hash = None
 
     def set_instrument(self, instrument):
         self._instrument = instrument
 
     def get_start_time(self):
-        if len(self._notes) == 0:
+        if not self._notes:
             return 0
         return self._notes[0].get_start_time()
 
     def add_note(self, note):
         self._notes.append(note)
+        self._notes_tuple = None
         self._hash = None
 
     def first(self):
@@ -33,25 +37,31 @@ class InstrumentSoundEvent(object):
     def get_notes(self):
         return self._notes
 
+    def _get_notes_tuple(self):
+        """
+        :return: tuple of the notes in sorted order by duration and pitch, built once and shared by hashing and equality
+        """
+        if self._notes_tuple is None:
+            self._notes_tuple = tuple(sorted(self._notes, key=attrgetter('duration', 'pitch')))
+        return self._notes_tuple
+
     def __hash__(self):
         """
         Builds the hash first if it is null. The hash is built by creating a tuple of notes and using the builtin
         hash function on the tuple
 
-        The tuple contains the notes in sorted order by duration because the tuple hashing function should not care
-        about the order of the notes
+        The tuple contains the notes in sorted order by duration and pitch because the tuple hashing function should
+        not care about the order of the notes
 
         Things the hash could include: pauses
         """
         if self._hash is None:
-            notes_tuple = ()
-            for note in sorted(self._notes, key=lambda key: self._notes[0].duration):
-                notes_tuple += (note,)
+            notes_tuple = self._get_notes_tuple()
             self._hash = (hash(notes_tuple) << 8) | len(notes_tuple)
         return self._hash
 
     def __eq__(self, other):
-        return self.__hash__() == other.__hash__()
+        return self._get_notes_tuple() == other._get_notes_tuple()
 
     def __str__(self):
         string = " "
@@ -80,14 +90,13 @@ class OrchestralSoundEvent(object):
         Sorted by instrument before hashing
         """
         if self._hash is None:
-            sound_events_tuple = ()
-            for instrument in sorted(self.get_instruments()):
-                sound_events_tuple += (self._instrument_sound_events[instrument],)
+            sound_events_tuple = tuple(self._instrument_sound_events[instrument]
+                                       for instrument in sorted(self.get_instruments()))
             self._hash = (hash(sound_events_tuple) << 8) | len(sound_events_tuple)
         return self._hash
 
     def __eq__(self, other):
-        return self.__hash__() == other.__hash__()
+        return self._instrument_sound_events == other._instrument_sound_events
 
     def __str__(self):
         string = str(self.__class__.__name__)
@@ -106,19 +115,29 @@ class Note(object):
 
     def __init__(self, start_time=0, duration=0, pitch=0, volume=0):
         self.start_time = start_time
-        self.duration = duration
         self.pitch = pitch
         self.volume = volume
-        self._hash = None
+        # set last since it also computes the hash from the pitch
+        self.duration = duration
+
+    @property
+    def duration(self):
+        return self._duration
+
+    @duration.setter
+    def duration(self, duration):
+        """
+        The reader sets the duration once the note ends, so the hash is recomputed here instead of on every lookup
+        """
+        self._duration = duration
+        self._hash = (duration << 8) | self.pitch
 
     # duration | tempo | pitch
     # bytes: >0 | 24 | 8
     def encoding(self):
-        return (self.duration << 8) | self.pitch
+        return self._hash
 
     def __hash__(self):
-        if self._hash is None:
-            self._hash = self.encoding()
         return self._hash
 
     def __eq__(self, other):
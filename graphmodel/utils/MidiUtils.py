@@ -3,6 +3,10 @@ import midi
 
 __author__ = 'Adisor'
 
+# event types that set music control, such as tempo and control changes
+MUSIC_CONTROL_EVENT_TYPES = frozenset([events.ControlChangeEvent, events.SetTempoEvent, events.AfterTouchEvent,
+                                       events.ChannelAfterTouchEvent, events.PitchWheelEvent, events.SysexEvent])
+
 
 def is_channel_event(event):
     """
@@ -34,9 +38,7 @@ def is_music_control_event(event):
     :param event: Midi Event
     :return: boolean
     """
-    event_type = get_event_type(event)
-    return event_type in [events.ControlChangeEvent, events.SetTempoEvent, events.AfterTouchEvent,
-                          events.ChannelAfterTouchEvent, events.PitchWheelEvent, events.SysexEvent]
+    return get_event_type(event) in MUSIC_CONTROL_EVENT_TYPES
 
 
 def is_time_signature_event(event):
@@ -44,7 +46,7 @@ def is_time_signature_event(event):
     :param event: Midi Event
     :return: boolean
     """
-    return isinstance(event, events.TimeSignatureEvent)
+    return type(event) is events.TimeSignatureEvent
 
 
 def is_set_tempo_event(event):
@@ -52,15 +54,11 @@ def is_set_tempo_event(event):
     :param event: Midi Event
     :return: boolean
     """
-    return isinstance(event, events.SetTempoEvent)
+    return type(event) is events.SetTempoEvent
 
 
-def is_event_with_channel(event):
-    """
-    :param event: Midi Event
-    :return: boolean
-    """
-    return isinstance(event, events.Event)
+# same check as is_channel_event, both names are kept for the existing callers
+is_event_with_channel = is_channel_event
 
 
 def is_key_signature_event(event):
@@ -68,7 +66,7 @@ def is_key_signature_event(event):
     :param event: Midi Event
     :return: boolean
     """
-    return isinstance(event, events.KeySignatureEvent)
+    return type(event) is events.KeySignatureEvent
 
 
 def is_control_change_event(event):
@@ -76,7 +74,7 @@ def is_control_change_event(event):
     :param event: Midi Event
     :return: boolean
     """
-    return event.name == events.ControlChangeEvent.name
+    return type(event) is events.ControlChangeEvent
 
 
 def is_port_event(event):
@@ -84,7 +82,7 @@ def is_port_event(event):
     :param event: Midi Event
     :return: boolean
     """
-    return isinstance(event, events.PortEvent)
+    return type(event) is events.PortEvent
 
 
 def is_program_change_event(event):
@@ -92,7 +90,7 @@ def is_program_change_event(event):
     :param event: Midi Event
     :return: boolean
     """
-    return isinstance(event, events.ProgramChangeEvent)
+    return type(event) is events.ProgramChangeEvent
 
 
 def has_note_ended(event):
@@ -100,7 +98,8 @@ def has_note_ended(event):
     :param event: Midi Event
     :return: boolean
     """
-    return isinstance(event, events.NoteOffEvent) or (isinstance(event, events.NoteOnEvent) and event.velocity == 0)
+    event_type = type(event)
+    return event_type is events.NoteOffEvent or (event_type is events.NoteOnEvent and event.velocity == 0)
 
 
 def is_new_note(event):
@@ -108,7 +107,7 @@ def is_new_note(event):
     :param event: Midi Event
     :return: boolean
     """
-    return isinstance(event, events.NoteOnEvent) and event.velocity > 0
+    return type(event) is events.NoteOnEvent and event.velocity > 0
 
 
 def to_note_on_event(note, channel):
@@ -137,11 +136,7 @@ def delete_tracks(pattern, start, stop):
     :param stop: end index
     :return: modified pattern
     """
-    tracks = []
-    for i in range(start, stop, 1):
-        tracks.append(pattern[i])
-    for track in tracks:
-        pattern.remove(track)
+    del pattern[start:stop]
 
 
 def convert_channel(track, channel):
@@ -185,10 +180,7 @@ def get_channel(track):
     :param track: Midi track
     :return: channel number
     """
-    for event in track:
-        if is_event_with_channel(event):
-            return event.channel
-    return None
+    return next((event.channel for event in track if is_event_with_channel(event)), None)
 
 
 def get_program_change_event(track):
@@ -244,10 +236,7 @@ def loop_track_and_return_event_on_condition(track, condition):
     :param condition: boolean function
     :return: Midi event
     """
-    for event in track:
-        if condition(event):
-            return event
-    return None
+    return next((event for event in track if condition(event)), None)
 
 
 def is_song_meta_event(event):
@@ -255,7 +244,8 @@ def is_song_meta_event(event):
     :param event: Midi event
     :return: boolean
     """
-    return isinstance(event, events.KeySignatureEvent) or isinstance(event, events.TimeSignatureEvent)
+    event_type = type(event)
+    return event_type is events.KeySignatureEvent or event_type is events.TimeSignatureEvent
 
 
 def remove_control_change_events(pattern):
@@ -267,7 +257,9 @@ def remove_control_change_events(pattern):
     for track in pattern:
         for event in track:
             if is_control_change_event(event):
-                event.data = [0, 0]
+                # reset the existing data list in place instead of allocating a new one per event
+                event.data[0] = 0
+                event.data[1] = 0
 
 
 def has_notes(track):
@@ -275,10 +267,7 @@ def has_notes(track):
     :param track: Midi track
     :return: boolean
     """
-    for event in track:
-        if is_new_note(event):
-            return True
-    return False
+    return any(is_new_note(event) for event in track)
 
 
 def hash_event(event):
@@ -287,11 +276,9 @@ def hash_event(event):
     :param event: Midi event
     :return: hash number
     """
-    string = ""
     if isinstance(event, events.AbstractEvent):
-        for byte in event.data:
-            string += chr(byte)
-    return hash(string)
+        return hash(tuple(event.data))
+    return 0
 
 
 def to_program_change_event(instrument):
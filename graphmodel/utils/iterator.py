@@ -4,10 +4,12 @@ __author__ = 'Adisor'
 class DictIterator(object):
     def __init__(self, iterable_dict):
         self.iterable_dict = iterable_dict
+        # keys are cached once since the dict is not modified while it is iterated
+        self.keys = list(iterable_dict.keys())
         self.current_index = 0
 
     def has_next(self):
-        return self.current_index < len(self.iterable_dict) - 1
+        return self.current_index < len(self.keys) - 1
 
     def has_previous(self):
         return self.current_index > 0
@@ -16,7 +18,7 @@ class DictIterator(object):
         return self.iterable_dict[self.current_key()]
 
     def current_key(self):
-        return self.iterable_dict.keys()[self.current_index]
+        return self.keys[self.current_index]
 
     def go_next(self):
         self.current_index += 1
@@ -27,4 +29,4 @@ class DictIterator(object):
         return self.current_key()
 
     def is_empty(self):
-        return len(self.iterable_dict) == 0
+        return len(self.keys) == 0